@@ -7,12 +7,19 @@ estandarizar la salida del proceso de chunking.
 """
 
 import re
-from typing import List, Tuple
+from typing import Iterable, Iterator, List, Optional, Tuple
 
 from .base_chunker import BaseChunker
 from .dto import BaseChunkDTO, ChunkMetadata
 from src.utils import get_logger
 
+# Whole lines that _is_chapter_start accepts, found in one pass over a segment:
+# optional leading whitespace, then "capítulo" (any case) or a Roman numeral word
+_CHAPTER_LINE_RE = re.compile(
+    r'^[^\S\n]*(?:(?i:capítulo)|[IVXLCDM]+\b)[^\n]*',
+    re.MULTILINE
+)
+
 
 class TextChunker(BaseChunker):
     """
@@ -64,57 +71,66 @@ class TextChunker(BaseChunker):
             self.logger.debug("Empty texts list provided, returning empty result")
             return []
 
+        dto_list = list(self.chunk_iter(texts=texts))
+
+        self.logger.info(
+            "Text chunking completed",
+            extra={
+                "input_texts_count": len(texts),
+                "chunks_count": len(dto_list),
+                "chapters_detected": sum(1 for dto in dto_list if dto.metadata.chapters),
+            }
+        )
+        return dto_list
+
+    def chunk_iter(
+        self,
+        *,
+        texts: Iterable[str],
+    ) -> Iterator[BaseChunkDTO]:
+        """
+        Lazily chunks texts, yielding one DTO as soon as each chunk is complete.
+
+        Produces the same chunks as chunk(), but only the chunk being built is
+        kept in memory, so callers can embed or store chunks as they arrive.
+
+        Args:
+            texts: Texts to chunk (typically pages); may be any iterable.
+
+        Yields:
+            BaseChunkDTO: DTO con el texto del chunk y sus metadatos.
+        """
         self.logger.debug(
             "Starting text chunking",
             extra={
-                "input_texts_count": len(texts),
                 "chunk_size": self.chunk_size,
                 "overlap": self.overlap,
             }
         )
 
         # Step 1: Ensure each text doesn't exceed chunk_size (split if necessary)
-        separate_texts, pages = self._ensure_length_segments(texts=texts)
+        segments = self._iter_length_segments(texts=texts)
 
         # Step 2: Group segments up to chunk_size
-        chunks, pages_groups = self._group_segments(
-            texts=separate_texts,
-            pages=pages
-        )
+        groups = self._iter_groups(segments=segments)
 
-        # Step 3: Detect chapters (always enabled)
-        chapters = self._get_chapters_of_segments(segments=chunks)
-
-        # Build DTOs
-        dto_list: List[BaseChunkDTO] = []
-        for i, chunk_text in enumerate(chunks):
-            pages_group = pages_groups[i] if i < len(pages_groups) else []
-            chapter_list = (
-                chapters[i]
-                if i < len(chapters) and chapters[i]
-                else None
+        # Step 3: Detect chapters (always enabled) and build DTOs
+        current_chapter = None
+        for chunk_text, pages_group in groups:
+            chapter_list, current_chapter = self._get_chapters_of_segment(
+                segment=chunk_text,
+                current_chapter=current_chapter
             )
 
             metadata = ChunkMetadata(
                 pages=pages_group,
-                chapters=chapter_list,
+                chapters=chapter_list or None,
             )
 
-            dto = BaseChunkDTO(
+            yield BaseChunkDTO(
                 text=chunk_text,
                 metadata=metadata,
             )
-            dto_list.append(dto)
-
-        self.logger.info(
-            "Text chunking completed",
-            extra={
-                "input_texts_count": len(texts),
-                "chunks_count": len(dto_list),
-                "chapters_detected": sum(1 for c in chapters if c),
-            }
-        )
-        return dto_list
 
     def _ensure_length_segments(
         self,
@@ -133,39 +149,67 @@ class TextChunker(BaseChunker):
         """
         result = []
         pages = []
+        for segment, page in self._iter_length_segments(texts=texts):
+            result.append(segment)
+            pages.append(page)
+
+        return result, pages
+
+    def _iter_length_segments(
+        self,
+        *,
+        texts: Iterable[str]
+    ) -> Iterator[Tuple[str, int]]:
+        """
+        Yields the texts split so that no segment exceeds chunk_size.
+        Splits at word boundaries to avoid cutting words.
+
+        Args:
+            texts: Texts to process.
+
+        Yields:
+            Tuple[str, int]: (segment, corresponding page number).
+        """
+        texts_count = 0
+        segments_count = 0
         split_count = 0
 
         for page, text in enumerate(texts, start=1):
-            original_length = len(text)
+            texts_count += 1
             text = text.strip()
+            text_length = len(text)
+            # Offset of the remaining text; only the emitted segments are copied
+            start = 0
 
-            while len(text) > self.chunk_size:
+            while text_length - start > self.chunk_size:
                 # Find last space within chunk_size limit
-                cut_point = text.rfind(' ', 0, self.chunk_size)
+                cut_point = text.rfind(' ', start, start + self.chunk_size)
                 if cut_point == -1:  # No space found, cut at chunk_size
-                    cut_point = self.chunk_size
+                    cut_point = start + self.chunk_size
 
-                result.append(text[:cut_point])
-                pages.append(page)
-                text = text[cut_point:].strip()
+                yield text[start:cut_point], page
+                segments_count += 1
                 split_count += 1
 
-            if text:  # Add remaining text if not empty
-                result.append(text)
-                pages.append(page)
+                # Skip the whitespace at the cut (the remaining text is already right-stripped)
+                start = cut_point
+                while start < text_length and text[start].isspace():
+                    start += 1
+
+            if start < text_length:  # Add remaining text if not empty
+                yield text[start:], page
+                segments_count += 1
 
         if split_count > 0:
             self.logger.debug(
                 "Texts split to ensure length constraints",
                 extra={
-                    "original_texts_count": len(texts),
-                    "result_segments_count": len(result),
+                    "original_texts_count": texts_count,
+                    "result_segments_count": segments_count,
                     "splits_performed": split_count
                 }
             )
 
-        return result, pages
-
     def _group_segments(
         self,
         *,
@@ -184,12 +228,31 @@ class TextChunker(BaseChunker):
         """
         grouped = []
         pages_groups = []
+        for grouped_text, pages_group in self._iter_groups(segments=zip(texts, pages)):
+            grouped.append(grouped_text)
+            pages_groups.append(pages_group)
 
+        return grouped, pages_groups
+
+    def _iter_groups(
+        self,
+        *,
+        segments: Iterable[Tuple[str, int]]
+    ) -> Iterator[Tuple[str, List[int]]]:
+        """
+        Groups text segments up to chunk_size, yielding each group once it is full.
+
+        Args:
+            segments: (text segment, page number) pairs.
+
+        Yields:
+            Tuple[str, List[int]]: (grouped chunk, sorted pages of the chunk).
+        """
         current_group = []
         current_pages = set()
         current_length = 0
 
-        for text, page in zip(texts, pages):
+        for text, page in segments:
             text = text.strip()
             text_length = len(text)
 
@@ -202,9 +265,7 @@ class TextChunker(BaseChunker):
             else:
                 # Save current group if not empty
                 if current_group:
-                    grouped_text = ' '.join(current_group)
-                    grouped.append(grouped_text)
-                    pages_groups.append(sorted(list(current_pages)))
+                    yield ' '.join(current_group), sorted(current_pages)
 
                     # Apply overlap if configured
                     if self.overlap > 0 and current_group:
@@ -212,7 +273,12 @@ class TextChunker(BaseChunker):
                         overlap_text = self._get_overlap_text(group=current_group)
                         current_group = [overlap_text, text] if overlap_text else [text]
                         current_pages = {page}
-                        current_length = len(' '.join(current_group))
+                        # Length of ' '.join(current_group), without building the string
+                        current_length = (
+                            len(overlap_text) + 1 + text_length
+                            if overlap_text
+                            else text_length
+                        )
                     else:
                         # Start new group with current text
                         current_group = [text]
@@ -221,10 +287,7 @@ class TextChunker(BaseChunker):
 
         # Add last group if not empty
         if current_group:
-            grouped.append(' '.join(current_group))
-            pages_groups.append(sorted(list(current_pages)))
-
-        return grouped, pages_groups
+            yield ' '.join(current_group), sorted(current_pages)
 
     def _get_overlap_text(
         self,
@@ -248,12 +311,14 @@ class TextChunker(BaseChunker):
         if len(last_text) <= self.overlap:
             return last_text
 
-        # Find overlap point (last space within overlap limit)
-        overlap_point = last_text.rfind(' ', len(last_text) - self.overlap)
+        # Find overlap point (just after the last space within overlap limit).
+        # Segments are already stripped, so only leading whitespace can remain.
+        start = len(last_text) - self.overlap
+        overlap_point = last_text.rfind(' ', start)
         if overlap_point == -1:
-            overlap_point = len(last_text) - self.overlap
+            return last_text[start:].lstrip()
 
-        return last_text[overlap_point:].strip()
+        return last_text[overlap_point + 1:].lstrip()
 
     def _get_chapters_of_segments(
         self,
@@ -273,25 +338,47 @@ class TextChunker(BaseChunker):
         current_chapter = None
 
         for segment in segments:
-            lines = segment.split("\n")
-            segment_chapters = set()
+            segment_chapters, current_chapter = self._get_chapters_of_segment(
+                segment=segment,
+                current_chapter=current_chapter
+            )
+            chapters.append(segment_chapters)
 
-            for line in lines:
-                if self._is_chapter_start(line=line):
-                    current_chapter = line.strip()
-                    # Limit chapter name length
-                    if len(current_chapter) > 500:
-                        current_chapter = current_chapter[:450]
+        return chapters
 
-                if current_chapter:
-                    segment_chapters.add(current_chapter)
+    @staticmethod
+    def _get_chapters_of_segment(
+        *,
+        segment: str,
+        current_chapter: Optional[str]
+    ) -> Tuple[List[str], Optional[str]]:
+        """
+        Detects the chapters of one segment, given the chapter carried over from previous segments.
 
-            if segment_chapters:
-                chapters.append(list(segment_chapters))
-            else:
-                chapters.append([])
+        Args:
+            segment: Text segment.
+            current_chapter: Last chapter seen in previous segments, if any.
 
-        return chapters
+        Returns:
+            Tuple[List[str], Optional[str]]: (chapters of the segment, chapter to carry over).
+        """
+        headings = list(_CHAPTER_LINE_RE.finditer(segment))
+        segment_chapters = set()
+
+        # The chapter carried over from previous segments applies
+        # unless the segment opens with a new chapter heading
+        if current_chapter and not (headings and headings[0].start() == 0):
+            segment_chapters.add(current_chapter)
+
+        for heading in headings:
+            current_chapter = heading.group().strip()
+            # Limit chapter name length
+            if len(current_chapter) > 500:
+                current_chapter = current_chapter[:450]
+
+            segment_chapters.add(current_chapter)
+
+        return list(segment_chapters), current_chapter
 
     @staticmethod
     def _is_chapter_start(*, line: str) -> bool:
@@ -304,17 +391,5 @@ class TextChunker(BaseChunker):
         Returns:
             bool: True if line appears to be a chapter start.
         """
-        line_stripped = line.strip()
-        if not line_stripped:
-            return False
-
-        # Check for "capítulo" (case insensitive)
-        if line_stripped.lower().startswith("capítulo"):
-            return True
-
-        # Check for Roman numerals (I, II, III, IV, V, etc.)
-        if re.match(r'^[IVXLCDM]+\b', line_stripped):
-            return True
-
-        return False
+        return _CHAPTER_LINE_RE.match(line.strip()) is not None
 
@@ -3,11 +3,21 @@ LLM-based image describer implementation
 Uses vision models to generate image descriptions
 """
 
+from functools import lru_cache
 from src.utils import get_logger
 from typing import Optional, Union, List
 from src.utils.utils import PromptLoader
 from src.llms.vision import BaseVisionModel
 
+# Separator the vision model must place between descriptions in a batched call
+BATCH_DESCRIPTION_SEPARATOR = "<<<IMAGE_DESCRIPTION_SEPARATOR>>>"
+
+BATCH_INSTRUCTIONS = (
+    "\n\nSe proporcionan {count} imágenes. Genera una descripción independiente para cada una, "
+    "en el mismo orden en que aparecen, y separa cada descripción de la siguiente con la línea "
+    "exacta {separator}. No incluyas el separador antes de la primera ni después de la última descripción."
+)
+
 class LLMImageDescriber:
     """
     Image describer using LLM vision models.
@@ -19,7 +29,8 @@ class LLMImageDescriber:
         *,
         vision_model: Optional[BaseVisionModel] = None,
         max_tokens: int = 1000,
-        temperature: float = 0.3
+        temperature: float = 0.3,
+        max_batch_tokens: int = 4096
     ):
         """
         Initializes the LLM image describer.
@@ -28,6 +39,8 @@ class LLMImageDescriber:
             vision_model: BaseVisionModel instance to use. Must be provided.
             max_tokens: Maximum tokens for the description (default 500).
             temperature: Temperature for generation (default 0.3, lower for more focused descriptions).
+            max_batch_tokens: Maximum tokens requested by one describe_images call (default 4096).
+                Set it to the output token limit of the vision model in use.
 
         Raises:
             ValueError: If vision_model is not provided or is not an instance of BaseVisionModel.
@@ -41,6 +54,7 @@ class LLMImageDescriber:
         self.vision_model: BaseVisionModel = vision_model
         self.max_tokens: int = max_tokens
         self.temperature: float = temperature
+        self.max_batch_tokens: int = max_batch_tokens
         self.logger = get_logger(__name__)
         
         self.logger.info(
@@ -48,6 +62,7 @@ class LLMImageDescriber:
             extra={
                 "max_tokens": max_tokens,
                 "temperature": temperature,
+                "max_batch_tokens": max_batch_tokens,
                 "vision_model_type": type(vision_model).__name__
             }
         )
@@ -131,10 +146,136 @@ class LLMImageDescriber:
             )
             raise Exception(f"Error generating image description: {str(e)}") from e
 
+    def describe_images(
+        self,
+        *,
+        images: List[str],
+        prompt: Optional[str] = None
+    ) -> List[str]:
+        """
+        Generates one description per image, describing several images per vision model call.
+
+        Images are sent in batches and the model is asked to separate the descriptions
+        with BATCH_DESCRIPTION_SEPARATOR. Each call requests max_tokens per image, so a
+        batch holds at most max_batch_tokens // max_tokens images. If max_tokens alone
+        exceeds max_batch_tokens, images are described one per call with max_tokens.
+
+        Args:
+            images: List of images encoded in base64 format (raw base64 strings or data URLs).
+            prompt: Optional custom prompt. If not provided, uses default description prompt.
+
+        Returns:
+            List[str]: Descriptions in the same order as images.
+
+        Raises:
+            ValueError: If images is not a non-empty list or contains empty images.
+            Exception: If description generation fails or a response does not contain
+                one description per image.
+        """
+        if isinstance(images, str):
+            self.logger.error("Image(s) cannot be empty and must be a list")
+            raise ValueError("Image(s) cannot be empty and must be a list")
+
+        # Materialize first so one-shot iterables are not consumed by the validation
+        images = list(images)
+        if not images or not all(images):
+            self.logger.error("Image(s) cannot be empty and must be a list")
+            raise ValueError("Image(s) cannot be empty and must be a list")
+        batch_size = max(1, self.max_batch_tokens // self.max_tokens)
+
+        self.logger.debug(
+            "Starting batched image description",
+            extra={
+                "images_count": len(images),
+                "batch_size": batch_size,
+                "has_custom_prompt": prompt is not None,
+                "temperature": self.temperature
+            }
+        )
+
+        # Build prompt using template if not provided
+        if prompt is None:
+            prompt = self._get_description_prompt()
+
+        descriptions: List[str] = []
+        for start in range(0, len(images), batch_size):
+            descriptions.extend(
+                self._describe_batch(
+                    images=images[start:start + batch_size],
+                    prompt=prompt
+                )
+            )
+
+        self.logger.info(
+            "Batched image descriptions generated successfully",
+            extra={
+                "images_count": len(images),
+                "descriptions_length": sum(len(d) for d in descriptions)
+            }
+        )
+
+        return descriptions
+
+    def _describe_batch(
+        self,
+        *,
+        images: List[str],
+        prompt: str
+    ) -> List[str]:
+        """
+        Describes a batch of images with a single vision model call.
+
+        Args:
+            images: Non-empty list of images, at most max_batch_tokens // max_tokens long.
+            prompt: Description prompt, without the batch instructions.
+
+        Returns:
+            List[str]: Descriptions in the same order as images.
+
+        Raises:
+            Exception: If the call fails or the response does not contain one description per image.
+        """
+        batch_prompt = prompt + BATCH_INSTRUCTIONS.format(
+            count=len(images),
+            separator=BATCH_DESCRIPTION_SEPARATOR
+        )
+
+        try:
+            response = self.vision_model.call_vision_model(
+                prompt=batch_prompt,
+                images=images,
+                max_tokens=self.max_tokens * len(images),
+                temperature=self.temperature
+            )
+
+            descriptions = [
+                description.strip()
+                for description in response.split(BATCH_DESCRIPTION_SEPARATOR)
+                if description.strip()
+            ]
+            if len(descriptions) != len(images):
+                raise ValueError(
+                    f"Expected {len(images)} descriptions, got {len(descriptions)}"
+                )
+
+            return descriptions
+        except Exception as e:
+            self.logger.error(
+                f"Error generating image descriptions: {str(e)}",
+                extra={
+                    "images_count": len(images),
+                    "error_type": type(e).__name__
+                },
+                exc_info=True
+            )
+            raise Exception(f"Error generating image descriptions: {str(e)}") from e
+
     @staticmethod
+    @lru_cache(maxsize=1)
     def _get_description_prompt() -> str:
         """
         Returns the default prompt template for image description.
+        The template file is read once per process and cached.
 
         Returns:
             str: Default prompt template for describing images.
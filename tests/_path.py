@@ -0,0 +1,10 @@
+"""
+Project paths shared by the test suite
+
+Resolved once per run; import PROJECT_ROOT instead of walking up from __file__.
+"""
+from pathlib import Path
+from typing import Final
+
+# _path.py -> tests/ -> project_root
+PROJECT_ROOT: Final[Path] = Path(__file__).resolve().parent.parent
@@ -0,0 +1,20 @@
+"""
+Shared pytest configuration for the test suite
+
+src/ and the project root are added to sys.path by the "pythonpath" option in pytest.ini.
+"""
+import pytest
+
+from tests._path import PROJECT_ROOT
+
+
+@pytest.fixture(scope="session")
+def project_root():
+    """Returns the path to the project root"""
+    return PROJECT_ROOT
+
+
+@pytest.fixture(scope="session")
+def mock_api_key():
+    """Returns a mock API key (an immutable string, safe to share across the session)"""
+    return "test-api-key-12345"
@@ -4,18 +4,12 @@ These tests make real API calls to OpenAI and require a valid API key.
 """
 import pytest
 import os
-from pathlib import Path
-import sys
 from dotenv import load_dotenv
 
-# Add project root to path so that "src" is a package (same as production)
-_current_file = Path(__file__).resolve()
-project_root = _current_file.parent.parent.parent.parent.parent
-if str(project_root) not in sys.path:
-    sys.path.insert(0, str(project_root))
+from tests._path import PROJECT_ROOT
 
 # Load .env file from project root
-env_path = project_root / ".env"
+env_path = PROJECT_ROOT / ".env"
 if env_path.exists():
     load_dotenv(env_path)
 
@@ -6,17 +6,12 @@ import pytest
 import os
 import base64
 from pathlib import Path
-import sys
 from dotenv import load_dotenv
 
-# Add project root to path so that "src" is a package (same as production)
-_current_file = Path(__file__).resolve()
-project_root = _current_file.parent.parent.parent.parent.parent
-if project_root not in sys.path:
-    sys.path.insert(0, str(project_root))
+from tests._path import PROJECT_ROOT
 
 # Load .env file from project root
-env_path = project_root / ".env"
+env_path = PROJECT_ROOT / ".env"
 if env_path.exists():
     load_dotenv(env_path)
 
@@ -70,7 +65,7 @@ def sample_image_base64():
 @pytest.fixture
 def penguin_image_base64():
     """Fixture to provide the penguin image from fixtures as base64"""
-    fixtures_path = project_root / "tests" / "fixtures" / "penguin.webp"
+    fixtures_path = PROJECT_ROOT / "tests" / "fixtures" / "penguin.webp"
     
     if not fixtures_path.exists():
         pytest.skip(f"Penguin image not found at {fixtures_path}")
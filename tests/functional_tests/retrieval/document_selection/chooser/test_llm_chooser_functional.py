@@ -4,25 +4,14 @@ These tests make real API calls to LLM providers and require a valid API key.
 """
 import pytest
 import os
-from pathlib import Path
-import sys
 from dotenv import load_dotenv
 
-# Add project root and src to path
-# Calculate project root: go up from test file to project root
-# test_llm_chooser_functional.py -> chooser/ -> document_selection/ -> retrieval/ -> functional_tests/ -> tests/ -> project_root
-_current_file = Path(__file__).resolve()
-project_root = _current_file.parent.parent.parent.parent.parent.parent
-src_path = project_root / "src"
-if project_root.exists():
-    sys.path.insert(0, str(project_root))
-if src_path.exists():
-    sys.path.insert(0, str(src_path))
-else:
-    raise ImportError(f"Could not find src directory at {src_path}")
+from tests._path import PROJECT_ROOT
+
+src_path = PROJECT_ROOT / "src"
 
 # Load .env file from project root
-env_path = project_root / ".env"
+env_path = PROJECT_ROOT / ".env"
 if env_path.exists():
     load_dotenv(env_path)
 
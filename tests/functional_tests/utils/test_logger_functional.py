@@ -4,25 +4,16 @@ These tests verify that the logger works correctly with console and MongoDB sink
 """
 import pytest
 import os
-import sys
 import time
-from pathlib import Path
 from dotenv import load_dotenv
 from io import StringIO
 from contextlib import redirect_stderr
 from datetime import datetime, timedelta
 
-# Add src to path
-_current_file = Path(__file__).resolve()
-project_root = _current_file.parent.parent.parent.parent
-src_path = project_root / "src"
-if src_path.exists():
-    sys.path.insert(0, str(src_path))
-else:
-    raise ImportError(f"Could not find src directory at {src_path}")
+from tests._path import PROJECT_ROOT
 
 # Load .env file from project root
-env_path = project_root / ".env"
+env_path = PROJECT_ROOT / ".env"
 if env_path.exists():
     load_dotenv(env_path)
 
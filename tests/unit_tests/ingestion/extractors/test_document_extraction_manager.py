@@ -6,20 +6,8 @@ import tempfile
 import os
 import shutil
 from pathlib import Path
-import sys
 import fitz  # PyMuPDF
 
-# Add src to path
-# Calculate project root: go up from test file to project root
-# test_document_extraction_manager.py -> extractors/ -> ingestion/ -> unit_tests/ -> tests/ -> project_root
-_current_file = Path(__file__).resolve()
-project_root = _current_file.parent.parent.parent.parent.parent
-src_path = project_root / "src"
-if src_path.exists():
-    sys.path.insert(0, str(src_path))
-else:
-    raise ImportError(f"Could not find src directory at {src_path}")
-
 from ingestion.extractors import DocumentExtractionManager
 from ingestion.types import ExtractionResult, BaseFileMetadata
 
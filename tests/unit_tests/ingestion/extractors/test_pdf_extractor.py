@@ -2,35 +2,25 @@
 Tests for PDFExtractor
 """
 import pytest
-import tempfile
+import base64
 import os
+from itertools import groupby
+from operator import attrgetter
 from pathlib import Path
-import sys
 import fitz  # PyMuPDF
 
-# Add src to path
-# Calculate project root: go up from test file to project root
-# test_pdf_extractor.py -> extractors/ -> ingestion/ -> unit_tests/ -> tests/ -> project_root
-_current_file = Path(__file__).resolve()
-project_root = _current_file.parent.parent.parent.parent.parent
-src_path = project_root / "src"
-if src_path.exists():
-    sys.path.insert(0, str(src_path))
-else:
-    raise ImportError(f"Could not find src directory at {src_path}")
-
 from ingestion.extractors.pdf_extractor import PDFExtractor
 
 
-@pytest.fixture
-def fixtures_dir():
+@pytest.fixture(scope="session")
+def fixtures_dir(project_root):
     """Returns the path to the fixtures directory"""
     return project_root / "tests" / "fixtures"
 
 
-@pytest.fixture
-def sample_pdf_file():
-    """Creates a temporary PDF file with text content for testing"""
+@pytest.fixture(scope="session")
+def sample_pdf_file(tmp_path_factory):
+    """Creates a temporary PDF file with text content, shared by the whole session (tests only read it)"""
     # Create a temporary PDF with text
     doc = fitz.open()  # Create a new PDF
 
@@ -44,38 +34,30 @@ def sample_pdf_file():
     page2.insert_text((50, 50), "This is page 2 of the PDF.")
     page2.insert_text((50, 70), "More sample text here.")
 
-    # Save to temporary file
-    temp_path = tempfile.NamedTemporaryFile(suffix='.pdf', delete=False).name
-    doc.save(temp_path)
+    # Serialize in memory and write the bytes once
+    file_path = tmp_path_factory.mktemp("pdfs") / "sample.pdf"
+    file_path.write_bytes(doc.tobytes())
     doc.close()
 
-    yield temp_path
-
-    # Cleanup
-    if os.path.exists(temp_path):
-        os.unlink(temp_path)
+    return str(file_path)
 
 
-@pytest.fixture
-def empty_pdf_file():
-    """Creates an empty PDF file (PDF with no content) for testing"""
+@pytest.fixture(scope="session")
+def empty_pdf_file(tmp_path_factory):
+    """Creates an empty PDF file (PDF with no content), shared by the whole session"""
     # Create a PDF with one empty page
     doc = fitz.open()  # Create a new PDF
     doc.new_page()  # Add one empty page
 
-    # Save to temporary file
-    temp_path = tempfile.NamedTemporaryFile(suffix='.pdf', delete=False).name
-    doc.save(temp_path)
+    # Serialize in memory and write the bytes once
+    file_path = tmp_path_factory.mktemp("pdfs") / "empty.pdf"
+    file_path.write_bytes(doc.tobytes())
     doc.close()
 
-    yield temp_path
-
-    # Cleanup
-    if os.path.exists(temp_path):
-        os.unlink(temp_path)
+    return str(file_path)
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def fixture_sample_pdf(fixtures_dir):
     """Returns path to sample.pdf fixture file from tests/fixtures/
 
@@ -87,7 +69,7 @@ def fixture_sample_pdf(fixtures_dir):
     return str(file_path)
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def fixture_sample_with_images_pdf(fixtures_dir):
     """Returns path to sample_with_images.pdf fixture file from tests/fixtures/
 
@@ -99,21 +81,43 @@ def fixture_sample_with_images_pdf(fixtures_dir):
     return str(file_path)
 
 
+@pytest.fixture(scope="module")
+def sample_extractor(sample_pdf_file):
+    """Returns a PDFExtractor for sample_pdf_file (extractors keep no state between calls)"""
+    return PDFExtractor(sample_pdf_file)
+
+
+@pytest.fixture(scope="module")
+def empty_extractor(empty_pdf_file):
+    """Returns a PDFExtractor for empty_pdf_file"""
+    return PDFExtractor(empty_pdf_file)
+
+
+@pytest.fixture(scope="module")
+def fixture_extractor(fixture_sample_pdf):
+    """Returns a PDFExtractor for the sample.pdf fixture file"""
+    return PDFExtractor(fixture_sample_pdf)
+
+
+@pytest.fixture(scope="module")
+def extracted_images(fixture_sample_with_images_pdf):
+    """Returns the images extracted from sample_with_images.pdf, computed once per module"""
+    return PDFExtractor(fixture_sample_with_images_pdf)._extract_images_from_pdf()
+
+
 class TestPDFExtractor:
     """Test class for PDFExtractor"""
 
-    def test_init(self, sample_pdf_file):
+    def test_init(self, sample_pdf_file, sample_extractor):
         """Test PDFExtractor initialization"""
-        extractor = PDFExtractor(sample_pdf_file)
 
-        assert extractor.file_path == Path(sample_pdf_file)
-        assert extractor.file_name == os.path.basename(sample_pdf_file)
-        assert extractor.file_type == '.pdf'
+        assert sample_extractor.file_path == Path(sample_pdf_file)
+        assert sample_extractor.file_name == os.path.basename(sample_pdf_file)
+        assert sample_extractor.file_type == '.pdf'
 
-    def test_get_metadata(self, sample_pdf_file):
+    def test_get_metadata(self, sample_pdf_file, sample_extractor):
         """Test get_metadata method"""
-        extractor = PDFExtractor(sample_pdf_file)
-        metadata = extractor.get_metadata()
+        metadata = sample_extractor.get_metadata()
 
         assert hasattr(metadata, 'file_name')
         assert hasattr(metadata, 'file_type')
@@ -124,10 +128,9 @@ class TestPDFExtractor:
         assert metadata.total_pages >= 1
         assert metadata.total_images >= 0
 
-    def test_extract_text_from_pdf(self, sample_pdf_file):
+    def test_extract_text_from_pdf(self, sample_extractor):
         """Test _extract_text_from_pdf method"""
-        extractor = PDFExtractor(sample_pdf_file)
-        text_pages = extractor._extract_text_from_pdf()
+        text_pages = sample_extractor._extract_text_from_pdf()
 
         assert isinstance(text_pages, list)
         assert len(text_pages) == 2  # Two pages in the test PDF
@@ -136,10 +139,9 @@ class TestPDFExtractor:
         assert "page 1" in text_pages[0].lower()
         assert "page 2" in text_pages[1].lower()
 
-    def test_extract_text_from_pdf_empty(self, empty_pdf_file):
+    def test_extract_text_from_pdf_empty(self, empty_extractor):
         """Test _extract_text_from_pdf with empty PDF"""
-        extractor = PDFExtractor(empty_pdf_file)
-        text_pages = extractor._extract_text_from_pdf()
+        text_pages = empty_extractor._extract_text_from_pdf()
 
         assert isinstance(text_pages, list)
         assert len(text_pages) == 1  # One empty page
@@ -147,10 +149,9 @@ class TestPDFExtractor:
         # Empty page may return empty string or whitespace
         assert text_pages[0].strip() == ""
 
-    def test_extract(self, sample_pdf_file):
+    def test_extract(self, sample_extractor):
         """Test extract method without images"""
-        extractor = PDFExtractor(sample_pdf_file)
-        result = extractor.extract(extract_images=False)
+        result = sample_extractor.extract(extract_images=False)
 
         assert hasattr(result, 'content')
         assert hasattr(result, 'images')
@@ -160,10 +161,9 @@ class TestPDFExtractor:
         assert result.images is None  # None when extract_images=False
         assert result.metadata.file_type == '.pdf'
 
-    def test_extract_empty(self, empty_pdf_file):
+    def test_extract_empty(self, empty_extractor):
         """Test extract with empty PDF"""
-        extractor = PDFExtractor(empty_pdf_file)
-        result = extractor.extract(extract_images=False)
+        result = empty_extractor.extract(extract_images=False)
 
         assert hasattr(result, 'content')
         assert hasattr(result, 'images')
@@ -173,10 +173,9 @@ class TestPDFExtractor:
         assert result.images is None
         assert result.content[0].strip() == ""
 
-    def test_extract_with_images_no_images_in_pdf(self, sample_pdf_file):
+    def test_extract_with_images_no_images_in_pdf(self, sample_extractor):
         """Test extract with extract_images=True but PDF has no images"""
-        extractor = PDFExtractor(sample_pdf_file)
-        result = extractor.extract(extract_images=True)
+        result = sample_extractor.extract(extract_images=True)
 
         assert hasattr(result, 'content')
         assert hasattr(result, 'images')
@@ -187,13 +186,12 @@ class TestPDFExtractor:
         assert len(result.images) == 0  # Should be empty list, not None
         assert result.metadata.file_type == '.pdf'
 
-    def test_extract_fixture(self, fixture_sample_pdf):
+    def test_extract_fixture(self, fixture_extractor):
         """Test extract with sample.pdf fixture file from tests/fixtures/
 
         Note: The user can modify the content of sample.pdf, but the file must be named 'sample.pdf'
         """
-        extractor = PDFExtractor(fixture_sample_pdf)
-        result = extractor.extract(extract_images=False)
+        result = fixture_extractor.extract(extract_images=False)
 
         # Generic assertions that work with any PDF file content
         assert hasattr(result, 'content')
@@ -229,10 +227,9 @@ class TestPDFExtractor:
         assert result.metadata.file_name == 'sample_with_images.pdf'
         assert result.metadata.file_type == '.pdf'
 
-    def test_extract_images_from_pdf(self, fixture_sample_with_images_pdf):
+    def test_extract_images_from_pdf(self, extracted_images):
         """Test _extract_images_from_pdf method with PDF that has images"""
-        extractor = PDFExtractor(fixture_sample_with_images_pdf)
-        images = extractor._extract_images_from_pdf()
+        images = extracted_images
 
         assert isinstance(images, list)
         assert len(images) > 0  # Should have at least one image
@@ -259,16 +256,12 @@ class TestPDFExtractor:
             assert len(image.image_base64) > 0  # Base64 string should not be empty
             assert len(image.image_format) > 0  # Format should not be empty
 
-            # Verify base64 is valid - try to decode it
-            # If it can be decoded, it's valid base64
-            import base64
-            decoded = base64.b64decode(image.image_base64, validate=True)
-            assert len(decoded) > 0  # Decoded image data should not be empty
+        # Verify base64 is valid and decodes to non-empty image data
+        assert all(base64.b64decode(image.image_base64, validate=True) for image in images)
 
-    def test_extract_images_from_pdf_image_numbering(self, fixture_sample_with_images_pdf):
+    def test_extract_images_from_pdf_image_numbering(self, extracted_images):
         """Test that image numbering is correct (page, image_number_in_page, total_image_number)"""
-        extractor = PDFExtractor(fixture_sample_with_images_pdf)
-        images = extractor._extract_images_from_pdf()
+        images = extracted_images
 
         if len(images) == 0:
             pytest.skip("PDF has no images to test numbering")
@@ -282,14 +275,9 @@ class TestPDFExtractor:
         assert all(page >= 1 for page in pages)
 
         # Verify image_number_in_page for each page
-        from collections import defaultdict
-        images_by_page = defaultdict(list)
-        for image in images:
-            images_by_page[image.page].append(image)
-
-        for page_num, page_images in images_by_page.items():
+        # Images come out in (page, image_number_in_page) order, so each page is a contiguous run
+        for page_num, page_images in groupby(images, key=attrgetter('page')):
             # Images on the same page should have sequential image_number_in_page
-            page_images.sort(key=lambda x: x.image_number_in_page)
             for i, image in enumerate(page_images):
                 assert image.image_number_in_page == i + 1, f"Page {page_num}, image {i} should have image_number_in_page={i+1}, got {image.image_number_in_page}"
 
@@ -297,16 +285,12 @@ class TestPDFExtractor:
         """Test extract with non-existent file"""
         extractor = PDFExtractor("nonexistent_file.pdf")
 
-        with pytest.raises(Exception) as exc_info:
+        with pytest.raises(Exception, match="Error extracting content"):
             extractor.extract()
 
-        assert "Error extracting content" in str(exc_info.value)
-
     def test_extract_text_from_pdf_error(self):
         """Test _extract_text_from_pdf with non-existent file"""
         extractor = PDFExtractor("nonexistent_file.pdf")
 
-        with pytest.raises(Exception) as exc_info:
+        with pytest.raises(Exception, match="Error extracting text from PDF"):
             extractor._extract_text_from_pdf()
-
-        assert "Error extracting text from PDF" in str(exc_info.value)
@@ -2,58 +2,35 @@
 Tests for TXTExtractor
 """
 import pytest
-import tempfile
 import os
 from pathlib import Path
-import sys
-
-# Add src to path
-# Calculate project root: go up from test file to project root
-# test_txt_extractor.py -> extractors/ -> ingestion/ -> unit_tests/ -> tests/ -> project_root
-_current_file = Path(__file__).resolve()
-project_root = _current_file.parent.parent.parent.parent.parent
-src_path = project_root / "src"
-if src_path.exists():
-    sys.path.insert(0, str(src_path))
-else:
-    raise ImportError(f"Could not find src directory at {src_path}")
 
 from ingestion.extractors.txt_extractor import TXTExtractor
 
 
 @pytest.fixture
-def fixtures_dir():
+def fixtures_dir(project_root):
     """Returns the path to the fixtures directory"""
     return project_root / "tests" / "fixtures"
 
 
 @pytest.fixture
-def sample_text_file():
+def sample_text_file(tmp_path):
     """Creates a temporary text file for testing"""
-    content = "This is a sample text file.\nIt has multiple lines.\nFor testing purposes."
-
-    with tempfile.NamedTemporaryFile(mode='w', suffix='.txt', delete=False, encoding='utf-8') as f:
-        f.write(content)
-        temp_path = f.name
-
-    yield temp_path
-
-    # Cleanup
-    if os.path.exists(temp_path):
-        os.unlink(temp_path)
+    file_path = tmp_path / "sample.txt"
+    file_path.write_text(
+        "This is a sample text file.\nIt has multiple lines.\nFor testing purposes.",
+        encoding='utf-8'
+    )
+    return str(file_path)
 
 
 @pytest.fixture
-def empty_text_file():
+def empty_text_file(tmp_path):
     """Creates an empty text file for testing"""
-    with tempfile.NamedTemporaryFile(mode='w', suffix='.txt', delete=False, encoding='utf-8') as f:
-        temp_path = f.name
-
-    yield temp_path
-
-    # Cleanup
-    if os.path.exists(temp_path):
-        os.unlink(temp_path)
+    file_path = tmp_path / "empty.txt"
+    file_path.write_text("", encoding='utf-8')
+    return str(file_path)
 
 
 @pytest.fixture
@@ -68,56 +45,48 @@ def fixture_sample_file(fixtures_dir):
 class TestTXTExtractor:
     """Test class for TXTExtractor"""
 
-    def test_init(self, sample_text_file):
-        """Test TXTExtractor initialization"""
+    def test_txt_extractor_readonly(self, sample_text_file):
+        """Test initialization, get_metadata, _read_text_file and extract on a single extractor"""
         extractor = TXTExtractor(sample_text_file)
+        file_name = os.path.basename(sample_text_file)
 
+        # Initialization
         assert extractor.file_path == Path(sample_text_file)
-        assert extractor.file_name == os.path.basename(sample_text_file)
+        assert extractor.file_name == file_name
         assert extractor.file_type == '.txt'
 
-    def test_get_metadata(self, sample_text_file):
-        """Test get_metadata method"""
-        extractor = TXTExtractor(sample_text_file)
+        # Metadata
         metadata = extractor.get_metadata()
-
         assert hasattr(metadata, 'file_name')
         assert hasattr(metadata, 'file_type')
         assert metadata.file_type == '.txt'
-        assert metadata.file_name == os.path.basename(sample_text_file)
+        assert metadata.file_name == file_name
 
-    def test_read_text_file(self, sample_text_file):
-        """Test _read_text_file method"""
-        extractor = TXTExtractor(sample_text_file)
+        # Raw read
         content = extractor._read_text_file()
-
         assert isinstance(content, str)
         assert "sample text file" in content
         assert "multiple lines" in content
 
-    def test_read_text_file_empty(self, empty_text_file):
-        """Test reading an empty text file"""
-        extractor = TXTExtractor(empty_text_file)
-        content = extractor._read_text_file()
-
-        assert isinstance(content, str)
-        assert content == ""
-
-    def test_extract(self, sample_text_file):
-        """Test extract method"""
-        extractor = TXTExtractor(sample_text_file)
+        # Extraction
         result = extractor.extract()
-
         assert hasattr(result, 'content')
         assert hasattr(result, 'images')
         assert hasattr(result, 'metadata')
         assert isinstance(result.content, list)
         assert len(result.content) == 1
-        assert isinstance(result.content[0], str)
-        assert "sample text file" in result.content[0]
+        assert result.content[0] == content
         assert result.images is None  # Text files don't have images
         assert result.metadata.file_type == '.txt'
 
+    def test_read_text_file_empty(self, empty_text_file):
+        """Test reading an empty text file"""
+        extractor = TXTExtractor(empty_text_file)
+        content = extractor._read_text_file()
+
+        assert isinstance(content, str)
+        assert content == ""
+
     def test_extract_empty(self, empty_text_file):
         """Test extract with empty file"""
         extractor = TXTExtractor(empty_text_file)
@@ -155,16 +124,12 @@ class TestTXTExtractor:
         """Test extract with non-existent file"""
         extractor = TXTExtractor("nonexistent_file.txt")
 
-        with pytest.raises(Exception) as exc_info:
+        with pytest.raises(Exception, match="Error extracting content"):
             extractor.extract()
 
-        assert "Error extracting content" in str(exc_info.value)
-
     def test_read_text_file_error(self):
         """Test _read_text_file with non-existent file"""
         extractor = TXTExtractor("nonexistent_file.txt")
 
-        with pytest.raises(Exception) as exc_info:
+        with pytest.raises(Exception, match="Error reading text file"):
             extractor._read_text_file()
-
-        assert "Error reading text file" in str(exc_info.value)
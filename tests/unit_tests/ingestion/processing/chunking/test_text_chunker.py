@@ -2,19 +2,6 @@
 Tests for TextChunker
 """
 import pytest
-from pathlib import Path
-import sys
-
-# Add src to path
-# Calculate project root: go up from test file to project root
-# test_text_chunker.py -> chunking/ -> processing/ -> ingestion/ -> unit_tests/ -> tests/ -> project_root
-_current_file = Path(__file__).resolve()
-project_root = _current_file.parent.parent.parent.parent.parent.parent
-src_path = project_root / "src"
-if src_path.exists():
-    sys.path.insert(0, str(src_path))
-else:
-    raise ImportError(f"Could not find src directory at {src_path}")
 
 from ingestion.processing.chunking.text_chunker import TextChunker
 from ingestion.processing.chunking.dto import BaseChunkDTO
@@ -92,51 +79,27 @@ class TestTextChunker:
         assert "Second page" in combined
         assert "Third page" in combined
     
-    def test_chunk_with_overlap(self):
-        """Test chunk with overlap between chunks"""
-        chunker = TextChunker(chunk_size=30, overlap=10)
-        texts = ["This is a longer text that will be split into multiple chunks with overlap between them."]
-        
-        result = chunker.chunk(texts=texts)
-        
-        assert isinstance(result, list)
-        assert len(result) > 1
-        
-        # Check that chunks overlap (last part of one chunk appears in next)
-        for i in range(len(result) - 1):
-            current_chunk = result[i].text
-            next_chunk = result[i + 1].text
-            # There should be some overlap (at least a few characters)
-            overlap_found = False
-            for j in range(min(len(current_chunk), len(next_chunk))):
-                if current_chunk[-j:] in next_chunk[:j+10]:
-                    overlap_found = True
-                    break
-            # Note: Overlap might not always be exact due to word boundaries
-            # So we just verify chunks are created
-    
-    def test_chunk_with_overlap_verification(self):
+    @pytest.mark.parametrize("chunk_size,overlap,text", [
+        (30, 10, "This is a longer text that will be split into multiple chunks with overlap between them."),
+        (50, 20, "First part of text. Second part of text. Third part of text. Fourth part of text."),
+    ])
+    def test_chunk_with_overlap(self, chunk_size, overlap, text):
         """Test chunk with overlap and verify overlap text appears"""
-        chunker = TextChunker(chunk_size=50, overlap=20)
-        texts = ["First part of text. Second part of text. Third part of text. Fourth part of text."]
+        chunker = TextChunker(chunk_size=chunk_size, overlap=overlap)
+        texts = [text]
         
         result = chunker.chunk(texts=texts)
         
         assert isinstance(result, list)
         assert len(result) > 1
         
-        # Verify that overlap is applied (chunks should share some text)
-        for i in range(len(result) - 1):
-            current_chunk = result[i].text
-            next_chunk = result[i + 1].text
-            # Get last words of current chunk
-            current_words = current_chunk.split()[-3:]
-            # Get first words of next chunk
-            next_words = next_chunk.split()[:3]
-            # There should be some common words (overlap)
-            common_words = set(current_words) & set(next_words)
-            # At least one word should overlap (allowing for word boundary adjustments)
-            assert len(common_words) > 0 or len(current_chunk) > 0
+        # Verify that overlap is applied: each chunk starts with a tail of the previous one
+        # no longer than the overlap (snapped to a word boundary)
+        for current, following in zip(result, result[1:]):
+            current_chunk = current.text
+            next_chunk = following.text
+            tail_starts = range(len(current_chunk) - chunker.overlap, len(current_chunk))
+            assert any(next_chunk.startswith(current_chunk[start:]) for start in tail_starts)
     
     def test_chunk_with_metadata(self):
         """Test chunk returns DTOs with metadata"""
@@ -207,6 +170,30 @@ class TestTextChunker:
                 words = chunk.split()
                 assert len(words) > 0  # Should have at least one word
     
+    def test_chunk_iter_matches_chunk(self):
+        """Test that chunk_iter yields the same DTOs as chunk"""
+        chunker = TextChunker(chunk_size=40, overlap=10)
+        texts = [
+            "CAPÍTULO 1\nFirst page content that is long enough to be split.",
+            "Second page content.",
+            "II\nThird page content here."
+        ]
+        
+        assert list(chunker.chunk_iter(texts=texts)) == chunker.chunk(texts=texts)
+    
+    def test_chunk_iter_is_lazy(self):
+        """Test that chunk_iter yields chunks before consuming the remaining texts"""
+        chunker = TextChunker(chunk_size=20)
+        
+        def pages():
+            yield "This first page holds more than one chunk of text."
+            raise AssertionError("second page should not be read")
+        
+        first = next(chunker.chunk_iter(texts=pages()))
+        
+        assert first.text == "This first page"
+        assert first.metadata.pages == [1]
+    
     def test_ensure_length_segments(self):
         """Test _ensure_length_segments method"""
         chunker = TextChunker(chunk_size=20)
@@ -288,6 +275,23 @@ class TestTextChunker:
         # Third segment should have chapter (Roman numeral)
         assert len(chapters[2]) > 0
     
+    def test_get_chapters_of_segments_carries_chapter(self):
+        """Test that the current chapter carries over until a segment opens with a new heading"""
+        chunker = TextChunker()
+        segments = [
+            "Capítulo I\nContent of first chapter.",
+            "More content of the first chapter.",
+            "Closing text.\n  Capítulo II  \nContent of second chapter.",
+            "CAPÍTULO III\nContent of third chapter."
+        ]
+        
+        chapters = chunker._get_chapters_of_segments(segments=segments)
+        
+        assert chapters[0] == ["Capítulo I"]
+        assert chapters[1] == ["Capítulo I"]
+        assert sorted(chapters[2]) == ["Capítulo I", "Capítulo II"]
+        assert chapters[3] == ["CAPÍTULO III"]
+    
     def test_is_chapter_start_capitulo(self):
         """Test _is_chapter_start with 'Capítulo'"""
         line = "Capítulo I: Introduction"
@@ -307,6 +311,12 @@ class TestTextChunker:
         line = "III Conclusion"
         assert TextChunker._is_chapter_start(line=line) is True
     
+    def test_is_chapter_start_roman_numeral_whole_word(self):
+        """Test _is_chapter_start only accepts Roman numerals as a whole word"""
+        assert TextChunker._is_chapter_start(line="IV. The Return") is True
+        assert TextChunker._is_chapter_start(line="Index of terms") is False
+        assert TextChunker._is_chapter_start(line="MIXED case word") is False
+    
     def test_is_chapter_start_not_chapter(self):
         """Test _is_chapter_start with non-chapter lines"""
         line = "This is regular text"
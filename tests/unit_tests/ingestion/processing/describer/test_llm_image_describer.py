@@ -1,32 +1,32 @@
 """
 Tests for LLMImageDescriber
 
-$env:PYTHONPATH="$PWD"; pytest tests/unit_tests/ingestion/processing/describer/test_llm_image_describer.py
+pytest tests/unit_tests/ingestion/processing/describer/test_llm_image_describer.py
 """
 import pytest
-from pathlib import Path
-import sys
 from unittest.mock import Mock, patch
 
-# Add project root to path so that "src" is a package (same as production)
-_current_file = Path(__file__).resolve()
-project_root = _current_file.parent.parent.parent.parent.parent.parent
-if project_root not in sys.path:
-    sys.path.insert(0, str(project_root))
-
 from src.llms.vision import BaseVisionModel
-from src.ingestion.processing.describer.llm_image_describer import LLMImageDescriber
+from src.ingestion.processing.describer.llm_image_describer import (
+    BATCH_DESCRIPTION_SEPARATOR,
+    LLMImageDescriber,
+)
 
 
 class MockVisionModel(BaseVisionModel):
     """Mock implementation of BaseVisionModel for testing"""
     
     def __init__(self):
+        self.reset()
+    
+    def reset(self):
+        """Clears recorded calls and restores the default response"""
         self.call_count = 0
         self.last_prompt = None
         self.last_images = None
         self.last_max_tokens = None
         self.last_temperature = None
+        self.response = "Mock image description response"
     
     def call_vision_model(
         self,
@@ -43,21 +43,29 @@ class MockVisionModel(BaseVisionModel):
         self.last_images = images
         self.last_max_tokens = max_tokens
         self.last_temperature = temperature
-        return "Mock image description response"
+        return self.response
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def mock_vision_model():
-    """Creates a mock vision model"""
+    """Creates a mock vision model shared by the whole module"""
     return MockVisionModel()
 
 
+@pytest.fixture(autouse=True)
+def _reset_mock_vision_model(mock_vision_model):
+    """Clears the calls and response recorded on the shared mock vision model before each test"""
+    mock_vision_model.reset()
+
+
 @pytest.fixture
 def mock_prompt_loader():
-    """Mocks PromptLoader.read_file"""
+    """Mocks PromptLoader.read_file (clearing the cached default prompt around each test)"""
+    LLMImageDescriber._get_description_prompt.cache_clear()
     with patch('src.ingestion.processing.describer.llm_image_describer.PromptLoader.read_file') as mock_read:
         mock_read.return_value = "System prompt for image description"
         yield mock_read
+    LLMImageDescriber._get_description_prompt.cache_clear()
 
 
 class TestLLMImageDescriber:
@@ -79,6 +87,7 @@ class TestLLMImageDescriber:
         describer_default = LLMImageDescriber(vision_model=mock_vision_model)
         assert describer_default.max_tokens == 1000
         assert describer_default.temperature == 0.3
+        assert describer_default.max_batch_tokens == 4096
     
     def test_init_with_invalid_vision_model_raises_error(self, mock_prompt_loader):
         """Test that initialization with invalid vision_model raises ValueError"""
@@ -157,9 +166,9 @@ class TestLLMImageDescriber:
             describer.describe_image(image=["", ""])
         assert "non-empty" in str(exc_info.value).lower() or "cannot be empty" in str(exc_info.value).lower()
     
-    def test_describe_image_vision_model_error_propagates(self, mock_vision_model, mock_prompt_loader):
+    def test_describe_image_vision_model_error_propagates(self, monkeypatch, mock_vision_model, mock_prompt_loader):
         """Test that errors from vision_model are propagated"""
-        mock_vision_model.call_vision_model = Mock(side_effect=Exception("API error"))
+        monkeypatch.setattr(mock_vision_model, "call_vision_model", Mock(side_effect=Exception("API error")))
         describer = LLMImageDescriber(vision_model=mock_vision_model)
         
         with pytest.raises(Exception) as exc_info:
@@ -168,6 +177,68 @@ class TestLLMImageDescriber:
         assert "Error generating image description" in str(exc_info.value)
         assert "API error" in str(exc_info.value)
     
+    def test_describe_images_batched(self, mock_vision_model, mock_prompt_loader):
+        """Test that describe_images describes all images with a single vision model call"""
+        describer = LLMImageDescriber(vision_model=mock_vision_model, max_tokens=100)
+        images = [f"data:image/png;base64,image{i}" for i in range(10)]
+        mock_vision_model.response = f"\n{BATCH_DESCRIPTION_SEPARATOR}\n".join(
+            f" Description {i} " for i in range(10)
+        )
+        
+        result = describer.describe_images(images=images)
+        
+        assert result == [f"Description {i}" for i in range(10)]
+        assert mock_vision_model.call_count == 1
+        assert mock_vision_model.last_images == images
+        assert mock_vision_model.last_max_tokens == 1000
+        assert mock_vision_model.last_prompt.startswith("System prompt for image description")
+        assert BATCH_DESCRIPTION_SEPARATOR in mock_vision_model.last_prompt
+    
+    def test_describe_images_splits_batches(self, monkeypatch, mock_vision_model, mock_prompt_loader):
+        """Test that describe_images keeps each call's token budget within max_batch_tokens"""
+        describer = LLMImageDescriber(vision_model=mock_vision_model, max_tokens=1000, max_batch_tokens=4096)
+        images = [f"data:image/png;base64,image{i}" for i in range(10)]
+        
+        def describe(*, prompt, images, max_tokens, temperature):
+            return f"\n{BATCH_DESCRIPTION_SEPARATOR}\n".join(image[-7:] for image in images)
+        
+        call_vision_model = Mock(side_effect=describe)
+        monkeypatch.setattr(mock_vision_model, "call_vision_model", call_vision_model)
+        
+        result = describer.describe_images(images=images)
+        
+        assert result == [image[-7:] for image in images]
+        assert [len(call.kwargs["images"]) for call in call_vision_model.call_args_list] == [4, 4, 2]
+        assert [call.kwargs["max_tokens"] for call in call_vision_model.call_args_list] == [4000, 4000, 2000]
+    
+    def test_describe_images_accepts_generator(self, mock_vision_model, mock_prompt_loader):
+        """Test that describe_images describes every image of a one-shot iterable"""
+        describer = LLMImageDescriber(vision_model=mock_vision_model)
+        mock_vision_model.response = f"\n{BATCH_DESCRIPTION_SEPARATOR}\n".join(
+            f"Description {i}" for i in range(3)
+        )
+        
+        result = describer.describe_images(images=(f"data:image/png;base64,image{i}" for i in range(3)))
+        
+        assert result == [f"Description {i}" for i in range(3)]
+        assert mock_vision_model.last_images == [f"data:image/png;base64,image{i}" for i in range(3)]
+    
+    def test_describe_images_errors(self, mock_vision_model, mock_prompt_loader):
+        """Test describe_images with empty input and with a response missing descriptions"""
+        describer = LLMImageDescriber(vision_model=mock_vision_model)
+        
+        with pytest.raises(ValueError, match="cannot be empty"):
+            describer.describe_images(images=[])
+        with pytest.raises(ValueError, match="cannot be empty"):
+            describer.describe_images(images=["data:image/png;base64,image1", ""])
+        # A single image string is not split into characters
+        with pytest.raises(ValueError, match="must be a list"):
+            describer.describe_images(images="data:image/png;base64,image1")
+        
+        # The mock returns a single description for two images
+        with pytest.raises(Exception, match="Expected 2 descriptions, got 1"):
+            describer.describe_images(images=["data:image/png;base64,image1", "data:image/png;base64,image2"])
+    
     def test_get_description_prompt(self, mock_prompt_loader):
         """Test that _get_description_prompt loads the correct template"""
         prompt = LLMImageDescriber._get_description_prompt()
@@ -175,3 +246,13 @@ class TestLLMImageDescriber:
         assert prompt == "System prompt for image description"
         assert isinstance(prompt, str)
         mock_prompt_loader.assert_called_once_with("src/ingestion/processing/describer/image_describer_prompt.md")
+    
+    def test_get_description_prompt_reads_file_once(self, mock_vision_model, mock_prompt_loader):
+        """Test that the default prompt template is read from disk only once"""
+        describer = LLMImageDescriber(vision_model=mock_vision_model)
+        
+        describer.describe_image(image="data:image/png;base64,image1")
+        describer.describe_image(image="data:image/png;base64,image2")
+        
+        assert mock_vision_model.last_prompt == "System prompt for image description"
+        mock_prompt_loader.assert_called_once()
@@ -2,269 +2,185 @@
 Tests for OpenAIEmbedder
 """
 import pytest
-import os
-from pathlib import Path
-import sys
+from types import SimpleNamespace
 from unittest.mock import Mock, patch, MagicMock
 
-# Add src to path
-# Calculate project root: go up from test file to project root
-# test_openai_embedder.py -> embeddings/ -> llms/ -> unit_tests/ -> tests/ -> project_root
-_current_file = Path(__file__).resolve()
-project_root = _current_file.parent.parent.parent.parent.parent
-src_path = project_root / "src"
-if src_path.exists():
-    sys.path.insert(0, str(src_path))
-else:
-    raise ImportError(f"Could not find src directory at {src_path}")
+from llms.embeddings.openai_embedder import OpenAIEmbedder, OPENAI_AVAILABLE
+from llms.embeddings.base_embedder import RateLimitError
 
-from src.llms.embeddings.openai_embedder import OpenAIEmbedder, OPENAI_AVAILABLE
-from src.llms.embeddings.base_embedder import RateLimitError
+pytestmark = pytest.mark.skipif(not OPENAI_AVAILABLE, reason="OpenAI package not installed")
 
 
 @pytest.fixture
 def mock_openai_client():
-    """Creates a mock OpenAI client"""
-    mock_client = Mock()
-    mock_response = Mock()
-    mock_response.data = [Mock()]
-    mock_response.data[0].embedding = [0.1, 0.2, 0.3, 0.4, 0.5]
-    mock_response.usage = Mock()
-    mock_response.usage.total_tokens = 10
-    mock_client.embeddings.create.return_value = mock_response
-    return mock_client
+    """Creates a mock OpenAI client (only create is a Mock, to record calls)"""
+    mock_response = SimpleNamespace(
+        data=[SimpleNamespace(embedding=[0.1, 0.2, 0.3, 0.4, 0.5])],
+        usage=SimpleNamespace(total_tokens=10)
+    )
+    return SimpleNamespace(embeddings=SimpleNamespace(create=Mock(return_value=mock_response)))
+
+
+@pytest.fixture(scope="module", autouse=True)
+def _patch_openai():
+    """Patches the OpenAI client class once for the whole module"""
+    with patch('llms.embeddings.openai_embedder.OpenAI') as mock_openai:
+        yield mock_openai
+
+
+@pytest.fixture(autouse=True)
+def _reset_patched_openai(_patch_openai):
+    """Clears calls and configured return values of the shared OpenAI patch before each test"""
+    _patch_openai.reset_mock(return_value=True, side_effect=True)
 
 
 @pytest.fixture
-def mock_api_key():
-    """Returns a mock API key"""
-    return "test-api-key-12345"
+def embedder(monkeypatch, mock_api_key, mock_openai_client, _patch_openai):
+    """Returns an OpenAIEmbedder wired to mock_openai_client"""
+    monkeypatch.setenv('OPENAI_API_KEY', mock_api_key)
+    _patch_openai.return_value = mock_openai_client
+    return OpenAIEmbedder()
 
 
-@pytest.mark.skipif(not OPENAI_AVAILABLE, reason="OpenAI package not installed")
 class TestOpenAIEmbedder:
     """Test class for OpenAIEmbedder (API key via OPENAI_API_KEY env var only)"""
 
-    def test_init_with_env_var(self, mock_api_key):
+    def test_init_with_env_var(self, monkeypatch, mock_api_key, _patch_openai):
         """Test OpenAIEmbedder initialization with environment variable"""
-        with patch.dict(os.environ, {'OPENAI_API_KEY': mock_api_key}):
-            with patch('src.llms.embeddings.openai_embedder.OpenAI') as mock_openai:
-                embedder = OpenAIEmbedder()
+        monkeypatch.setenv('OPENAI_API_KEY', mock_api_key)
+        embedder = OpenAIEmbedder()
 
-                assert embedder.api_key == mock_api_key
-                assert embedder.model == "text-embedding-3-small"
-                assert embedder.count_tokens is True
-                mock_openai.assert_called_once_with(api_key=mock_api_key)
+        assert embedder.api_key == mock_api_key
+        assert embedder.model == "text-embedding-3-small"
+        assert embedder.count_tokens is True
+        _patch_openai.assert_called_once_with(api_key=mock_api_key)
 
-    def test_init_no_api_key(self):
+    def test_init_no_api_key(self, monkeypatch):
         """Test OpenAIEmbedder initialization without API key"""
-        with patch.dict(os.environ, {}, clear=True):
-            with pytest.raises(ValueError) as exc_info:
-                OpenAIEmbedder()
+        monkeypatch.delenv('OPENAI_API_KEY', raising=False)
+        with pytest.raises(ValueError) as exc_info:
+            OpenAIEmbedder()
 
-            assert "OpenAI API key is required" in str(exc_info.value)
+        assert "OpenAI API key is required" in str(exc_info.value)
 
-    def test_init_custom_model(self, mock_api_key):
+    def test_init_custom_model(self, monkeypatch, mock_api_key):
         """Test OpenAIEmbedder initialization with custom model"""
-        with patch.dict(os.environ, {'OPENAI_API_KEY': mock_api_key}):
-            with patch('src.llms.embeddings.openai_embedder.OpenAI'):
-                embedder = OpenAIEmbedder(
-                    model="text-embedding-3-large",
-                    count_tokens=False
-                )
+        monkeypatch.setenv('OPENAI_API_KEY', mock_api_key)
+        embedder = OpenAIEmbedder(
+            model="text-embedding-3-large",
+            count_tokens=False
+        )
 
-                assert embedder.model == "text-embedding-3-large"
-                assert embedder.count_tokens is False
+        assert embedder.model == "text-embedding-3-large"
+        assert embedder.count_tokens is False
 
-    def test_generate_embedding_success(self, mock_api_key, mock_openai_client):
+    def test_generate_embedding_success(self, embedder, mock_openai_client):
         """Test generate_embedding with successful response"""
-        with patch.dict(os.environ, {'OPENAI_API_KEY': mock_api_key}):
-            with patch('src.llms.embeddings.openai_embedder.OpenAI', return_value=mock_openai_client):
-                embedder = OpenAIEmbedder()
+        embedding, token_count = embedder.generate_embedding(text="Test text")
 
-                embedding, token_count = embedder.generate_embedding(text="Test text")
+        assert isinstance(embedding, list)
+        assert len(embedding) == 5
+        assert embedding == [0.1, 0.2, 0.3, 0.4, 0.5]
+        assert token_count == 10
+        mock_openai_client.embeddings.create.assert_called_once()
 
-                assert isinstance(embedding, list)
-                assert len(embedding) == 5
-                assert embedding == [0.1, 0.2, 0.3, 0.4, 0.5]
-                assert token_count == 10
-                mock_openai_client.embeddings.create.assert_called_once()
-
-    def test_generate_embedding_without_token_count(self, mock_api_key):
+    def test_generate_embedding_without_token_count(self, monkeypatch, mock_api_key, mock_openai_client, _patch_openai):
         """Test generate_embedding with count_tokens=False"""
-        mock_client = Mock()
-        mock_response = Mock()
-        mock_response.data = [Mock()]
-        mock_response.data[0].embedding = [0.1, 0.2, 0.3]
-        mock_client.embeddings.create.return_value = mock_response
-
-        with patch.dict(os.environ, {'OPENAI_API_KEY': mock_api_key}):
-            with patch('src.llms.embeddings.openai_embedder.OpenAI', return_value=mock_client):
-                embedder = OpenAIEmbedder(count_tokens=False)
+        monkeypatch.setenv('OPENAI_API_KEY', mock_api_key)
+        _patch_openai.return_value = mock_openai_client
+        mock_openai_client.embeddings.create.return_value = SimpleNamespace(
+            data=[SimpleNamespace(embedding=[0.1, 0.2, 0.3])]
+        )
+        embedder = OpenAIEmbedder(count_tokens=False)
 
-                embedding, token_count = embedder.generate_embedding(text="Test text")
+        embedding, token_count = embedder.generate_embedding(text="Test text")
 
-                assert isinstance(embedding, list)
-                assert token_count is None
+        assert isinstance(embedding, list)
+        assert token_count is None
 
-    def test_generate_embedding_fallback_token_count(self, mock_api_key):
+    def test_generate_embedding_fallback_token_count(self, embedder, mock_openai_client):
         """Test generate_embedding with fallback token count estimation"""
-        mock_client = Mock()
-        mock_response = Mock()
-        mock_response.data = [Mock()]
-        mock_response.data[0].embedding = [0.1, 0.2, 0.3]
-        del mock_response.usage
-        mock_client.embeddings.create.return_value = mock_response
+        # Response without usage information
+        mock_openai_client.embeddings.create.return_value = SimpleNamespace(
+            data=[SimpleNamespace(embedding=[0.1, 0.2, 0.3])]
+        )
 
-        with patch.dict(os.environ, {'OPENAI_API_KEY': mock_api_key}):
-            with patch('src.llms.embeddings.openai_embedder.OpenAI', return_value=mock_client):
-                embedder = OpenAIEmbedder(count_tokens=True)
+        text = "Test text with approximately 40 characters"
+        embedding, token_count = embedder.generate_embedding(text=text)
 
-                text = "Test text with approximately 40 characters"
-                embedding, token_count = embedder.generate_embedding(text=text)
+        assert isinstance(embedding, list)
+        assert token_count is not None
+        assert token_count > 0
 
-                assert isinstance(embedding, list)
-                assert token_count is not None
-                assert token_count > 0
-
-    def test_generate_embedding_empty_text(self, mock_api_key):
+    def test_generate_embedding_empty_text(self, embedder):
         """Test generate_embedding with empty text"""
-        with patch.dict(os.environ, {'OPENAI_API_KEY': mock_api_key}):
-            with patch('src.llms.embeddings.openai_embedder.OpenAI'):
-                embedder = OpenAIEmbedder()
-
-                with pytest.raises(ValueError) as exc_info:
-                    embedder.generate_embedding(text="")
+        with pytest.raises(ValueError) as exc_info:
+            embedder.generate_embedding(text="")
 
-                assert "text must be a non-empty string" in str(exc_info.value)
+        assert "text must be a non-empty string" in str(exc_info.value)
 
-    def test_generate_embedding_invalid_text(self, mock_api_key):
+    def test_generate_embedding_invalid_text(self, embedder):
         """Test generate_embedding with invalid text type"""
-        with patch.dict(os.environ, {'OPENAI_API_KEY': mock_api_key}):
-            with patch('src.llms.embeddings.openai_embedder.OpenAI'):
-                embedder = OpenAIEmbedder()
+        with pytest.raises(ValueError) as exc_info:
+            embedder.generate_embedding(text=None)
 
-                with pytest.raises(ValueError) as exc_info:
-                    embedder.generate_embedding(text=None)
+        assert "text must be a non-empty string" in str(exc_info.value)
 
-                assert "text must be a non-empty string" in str(exc_info.value)
+    @pytest.mark.parametrize("error_msg", [
+        "429 Too Many Requests",
+        "429",
+        "Too Many Requests",
+        "rate_limit exceeded",
+    ])
+    def test_generate_embedding_rate_limit_error(self, embedder, mock_openai_client, error_msg):
+        """Test generate_embedding with the different rate limit error messages"""
+        mock_openai_client.embeddings.create.side_effect = Exception(error_msg)
 
-    def test_generate_embedding_rate_limit_error(self, mock_api_key):
-        """Test generate_embedding with rate limit error"""
-        mock_client = Mock()
-        mock_client.embeddings.create.side_effect = Exception("429 Too Many Requests")
+        with pytest.raises(RateLimitError) as exc_info:
+            embedder.generate_embedding(text="Test text")
 
-        with patch.dict(os.environ, {'OPENAI_API_KEY': mock_api_key}):
-            with patch('src.llms.embeddings.openai_embedder.OpenAI', return_value=mock_client):
-                embedder = OpenAIEmbedder()
+        assert "Rate limit exceeded" in str(exc_info.value)
 
-                with pytest.raises(RateLimitError) as exc_info:
-                    embedder.generate_embedding(text="Test text")
-
-                assert "Rate limit exceeded" in str(exc_info.value)
-
-    def test_generate_embedding_rate_limit_error_variations(self, mock_api_key):
-        """Test generate_embedding with different rate limit error messages"""
-        error_messages = [
-            "429",
-            "Too Many Requests",
-            "rate_limit exceeded"
-        ]
-
-        with patch.dict(os.environ, {'OPENAI_API_KEY': mock_api_key}):
-            for error_msg in error_messages:
-                mock_client = Mock()
-                mock_client.embeddings.create.side_effect = Exception(error_msg)
-
-                with patch('src.llms.embeddings.openai_embedder.OpenAI', return_value=mock_client):
-                    embedder = OpenAIEmbedder()
-
-                    with pytest.raises(RateLimitError):
-                        embedder.generate_embedding(text="Test text")
-
-    def test_generate_embedding_general_error(self, mock_api_key):
+    def test_generate_embedding_general_error(self, embedder, mock_openai_client):
         """Test generate_embedding with general error"""
-        mock_client = Mock()
-        mock_client.embeddings.create.side_effect = Exception("Connection error")
-
-        with patch.dict(os.environ, {'OPENAI_API_KEY': mock_api_key}):
-            with patch('src.llms.embeddings.openai_embedder.OpenAI', return_value=mock_client):
-                embedder = OpenAIEmbedder()
+        mock_openai_client.embeddings.create.side_effect = Exception("Connection error")
 
-                with pytest.raises(Exception) as exc_info:
-                    embedder.generate_embedding(text="Test text")
+        with pytest.raises(Exception) as exc_info:
+            embedder.generate_embedding(text="Test text")
 
-                assert "Error generating embedding with OpenAI" in str(exc_info.value)
+        assert "Error generating embedding with OpenAI" in str(exc_info.value)
 
-    def test_generate_embedding_strips_text(self, mock_api_key, mock_openai_client):
+    def test_generate_embedding_strips_text(self, embedder, mock_openai_client):
         """Test that generate_embedding strips whitespace from text"""
-        with patch.dict(os.environ, {'OPENAI_API_KEY': mock_api_key}):
-            with patch('src.llms.embeddings.openai_embedder.OpenAI', return_value=mock_openai_client):
-                embedder = OpenAIEmbedder()
+        embedder.generate_embedding(text="  Test text  ")
 
-                embedder.generate_embedding(text="  Test text  ")
+        call_args = mock_openai_client.embeddings.create.call_args
+        assert call_args[1]['input'] == "Test text"
 
-                call_args = mock_openai_client.embeddings.create.call_args
-                assert call_args[1]['input'] == "Test text"
+    @pytest.mark.parametrize("model,expected", [
+        (None, 1536),
+        ("text-embedding-3-small", 1536),
+        ("text-embedding-3-large", 3072),
+        ("text-embedding-ada-002", 1536),
+        ("text-embedding-2", 1536),
+    ])
+    def test_dimensions(self, monkeypatch, mock_api_key, model, expected):
+        """Test dimensions for each supported model (None uses the default text-embedding-3-small)"""
+        monkeypatch.setenv('OPENAI_API_KEY', mock_api_key)
+        embedder = OpenAIEmbedder(**({"model": model} if model else {}))
 
-    def test_dimensions_default_model(self, mock_api_key):
-        """Test dimensions with default model (text-embedding-3-small)"""
-        with patch.dict(os.environ, {'OPENAI_API_KEY': mock_api_key}):
-            with patch('src.llms.embeddings.openai_embedder.OpenAI'):
-                embedder = OpenAIEmbedder()
+        dimensions = embedder.dimensions
 
-                dimensions = embedder.dimensions
+        assert isinstance(dimensions, int)
+        assert dimensions == expected
 
-                assert dimensions == 1536
-
-    def test_dimensions_text_embedding_3_small(self, mock_api_key):
-        """Test dimensions with text-embedding-3-small model"""
-        with patch.dict(os.environ, {'OPENAI_API_KEY': mock_api_key}):
-            with patch('src.llms.embeddings.openai_embedder.OpenAI'):
-                embedder = OpenAIEmbedder(model="text-embedding-3-small")
-
-                dimensions = embedder.dimensions
-
-                assert dimensions == 1536
-
-    def test_dimensions_text_embedding_3_large(self, mock_api_key):
-        """Test dimensions with text-embedding-3-large model"""
-        with patch.dict(os.environ, {'OPENAI_API_KEY': mock_api_key}):
-            with patch('src.llms.embeddings.openai_embedder.OpenAI'):
-                embedder = OpenAIEmbedder(model="text-embedding-3-large")
-
-                dimensions = embedder.dimensions
-
-                assert dimensions == 3072
-
-    def test_dimensions_text_embedding_ada_002(self, mock_api_key):
-        """Test dimensions with text-embedding-ada-002 model"""
-        with patch.dict(os.environ, {'OPENAI_API_KEY': mock_api_key}):
-            with patch('src.llms.embeddings.openai_embedder.OpenAI'):
-                embedder = OpenAIEmbedder(model="text-embedding-ada-002")
-
-                dimensions = embedder.dimensions
-
-                assert dimensions == 1536
-
-    def test_dimensions_text_embedding_2(self, mock_api_key):
-        """Test dimensions with text-embedding-2 model"""
-        with patch.dict(os.environ, {'OPENAI_API_KEY': mock_api_key}):
-            with patch('src.llms.embeddings.openai_embedder.OpenAI'):
-                embedder = OpenAIEmbedder(model="text-embedding-2")
-
-                dimensions = embedder.dimensions
-
-                assert dimensions == 1536
-
-    def test_dimensions_unknown_model(self, mock_api_key):
+    def test_dimensions_unknown_model(self, monkeypatch, mock_api_key):
         """Test dimensions with unknown model raises ValueError"""
-        with patch.dict(os.environ, {'OPENAI_API_KEY': mock_api_key}):
-            with patch('src.llms.embeddings.openai_embedder.OpenAI'):
-                with pytest.raises(ValueError) as exc_info:
-                    OpenAIEmbedder(model="unknown-model")
-
-                assert "Unknown model" in str(exc_info.value)
-                assert "unknown-model" in str(exc_info.value)
-                assert "MODEL_DIMENSIONS" in str(exc_info.value)
+        monkeypatch.setenv('OPENAI_API_KEY', mock_api_key)
+        with pytest.raises(ValueError) as exc_info:
+            OpenAIEmbedder(model="unknown-model")
+
+        assert "Unknown model" in str(exc_info.value)
+        assert "unknown-model" in str(exc_info.value)
+        assert "MODEL_DIMENSIONS" in str(exc_info.value)
 
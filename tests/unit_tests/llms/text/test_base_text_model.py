@@ -2,21 +2,8 @@
 Tests for BaseTextModel
 """
 import pytest
-from pathlib import Path
-import sys
 from abc import ABC
 
-# Add src to path
-# Calculate project root: go up from test file to project root
-# test_base_text_model.py -> text/ -> llms/ -> unit_tests/ -> tests/ -> project_root
-_current_file = Path(__file__).resolve()
-project_root = _current_file.parent.parent.parent.parent.parent
-src_path = project_root / "src"
-if src_path.exists():
-    sys.path.insert(0, str(src_path))
-else:
-    raise ImportError(f"Could not find src directory at {src_path}")
-
 from llms.text.base_text_model import BaseTextModel
 
 
@@ -50,6 +37,7 @@ class MockTextModel(BaseTextModel):
 class TestBaseTextModel:
     """Test class for BaseTextModel"""
     
+    @pytest.mark.smoke
     def test_is_abstract_class(self):
         """Test that BaseTextModel is an abstract class"""
         assert issubclass(BaseTextModel, ABC)
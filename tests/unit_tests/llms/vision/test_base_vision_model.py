@@ -2,21 +2,8 @@
 Tests for BaseVisionModel
 """
 import pytest
-from pathlib import Path
-import sys
 from abc import ABC
 
-# Add src to path
-# Calculate project root: go up from test file to project root
-# test_base_vision_model.py -> vision/ -> llms/ -> unit_tests/ -> tests/ -> project_root
-_current_file = Path(__file__).resolve()
-project_root = _current_file.parent.parent.parent.parent.parent
-src_path = project_root / "src"
-if src_path.exists():
-    sys.path.insert(0, str(src_path))
-else:
-    raise ImportError(f"Could not find src directory at {src_path}")
-
 from llms.vision.base_vision_model import BaseVisionModel
 
 
@@ -47,6 +34,7 @@ class MockVisionModel(BaseVisionModel):
 class TestBaseVisionModel:
     """Test class for BaseVisionModel"""
     
+    @pytest.mark.smoke
     def test_is_abstract_class(self):
         """Test that BaseVisionModel is an abstract class"""
         assert issubclass(BaseVisionModel, ABC)